@@ -3,9 +3,7 @@
 Analyze the live email against our quality criteria
 """
 
-import sys
 import os
-sys.path.append('src')
 
 from sales_personalized_email.email_quality_validator import EmailQualityValidator
 
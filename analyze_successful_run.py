@@ -3,9 +3,8 @@
 Analyze the one successful run in detail
 """
 
-import sys
 import json
-sys.path.append('src')
+
 from sales_personalized_email.email_quality_validator import EmailQualityValidator
 
 def analyze_successful_run():
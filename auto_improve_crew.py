@@ -6,8 +6,8 @@ Automatically tests, analyzes, and improves crew prompts until achieving 95% pas
 Uses LLM-powered analysis to adapt agent and task prompts based on real failures.
 
 Usage:
-    python auto_improve_crew.py --max-iterations 10 --target-pass-rate 0.95 --num-prospects 20
-    python auto_improve_crew.py --test-only --num-prospects 20
+    uv run python auto_improve_crew.py --max-iterations 10 --target-pass-rate 0.95 --num-prospects 20
+    uv run python auto_improve_crew.py --test-only --num-prospects 20
 """
 
 import argparse
@@ -19,10 +19,10 @@ from datetime import datetime
 from typing import Optional
 from dataclasses import dataclass, asdict
 
-from src.sales_personalized_email.prospect_generator import RandomProspectGenerator
-from src.sales_personalized_email.test_runner import CrewTestRunner
-from src.sales_personalized_email.failure_analyzer import FailureAnalyzer
-from src.sales_personalized_email.prompt_adapter import PromptAdapter
+from sales_personalized_email.prospect_generator import RandomProspectGenerator
+from sales_personalized_email.test_runner import CrewTestRunner
+from sales_personalized_email.failure_analyzer import FailureAnalyzer
+from sales_personalized_email.prompt_adapter import PromptAdapter
 
 
 @dataclass
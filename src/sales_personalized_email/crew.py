@@ -1,3 +1,5 @@
+import os
+
 from crewai_tools import ScrapeWebsiteTool, SerperDevTool
 from pydantic import BaseModel, Field
 from typing import Optional
@@ -5,6 +7,9 @@ from typing import Optional
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 
+# Set CREWAI_VERBOSE=0 to silence agent/crew step logging (e.g. during test runs)
+VERBOSE = os.getenv("CREWAI_VERBOSE", "1") != "0"
+
 
 class ProspectData(BaseModel):
     first_name: str = Field(..., description="First name of the prospect")
@@ -39,7 +44,7 @@ class SalesPersonalizedEmailCrew:
             config=self.agents_config["linkedin_researcher"],
             tools=[SerperDevTool(), ScrapeWebsiteTool()],
             allow_delegation=False,
-            verbose=True,
+            verbose=VERBOSE,
         )
 
     @agent
@@ -48,7 +53,7 @@ class SalesPersonalizedEmailCrew:
             config=self.agents_config["prospect_researcher"],
             tools=[SerperDevTool(), ScrapeWebsiteTool()],
             allow_delegation=False,
-            verbose=True,
+            verbose=VERBOSE,
         )
 
     @agent
@@ -57,7 +62,7 @@ class SalesPersonalizedEmailCrew:
             config=self.agents_config["content_personalizer"],
             tools=[SerperDevTool(), ScrapeWebsiteTool()],
             allow_delegation=False,
-            verbose=True,
+            verbose=VERBOSE,
         )
 
     @agent
@@ -66,7 +71,7 @@ class SalesPersonalizedEmailCrew:
             config=self.agents_config["email_copywriter"],
             tools=[],
             allow_delegation=False,
-            verbose=True,
+            verbose=VERBOSE,
         )
 
     @task
@@ -105,6 +110,6 @@ class SalesPersonalizedEmailCrew:
             agents=self.agents,  # Automatically created by the @agent decorator
             tasks=self.tasks,  # Automatically created by the @task decorator
             process=Process.sequential,
-            verbose=True,
+            verbose=VERBOSE,
             # process=Process.hierarchical, # In case you wanna use that instead https://docs.crewai.com/how-to/Hierarchical/
         )
@@ -6,11 +6,20 @@ Implements the 100-point quality scoring system from AUTO_IMPROVEMENT_SPEC.md
 
 import re
 import json
-from typing import Dict, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Any
+from dataclasses import dataclass, field, fields
 
 
-@dataclass
+# Category pass thresholds (80% of category maximum)
+STRUCTURE_OK_THRESHOLD = 28  # of 35
+PERSONALIZATION_OK_THRESHOLD = 20  # of 25
+MESSAGE_OK_THRESHOLD = 20  # of 25
+
+# Degenerate emails (too short to hold a subject and body) skip scoring entirely
+MIN_EMAIL_LENGTH = 50
+
+
+@dataclass(slots=True)
 class QualityScore:
     total_score: int
     structure_score: int
@@ -18,6 +27,22 @@ class QualityScore:
     message_score: int
     intent_score: int
     details: Dict[str, Any]
+    # Derived at construction so hot-path checks avoid nested dict walks
+    cta_score: int = field(init=False)
+    structure_ok: bool = field(init=False)
+    personalization_ok: bool = field(init=False)
+    message_ok: bool = field(init=False)
+    
+    def __post_init__(self):
+        self.cta_score = self.details.get('structure', {}).get('details', {}).get('call_to_action', 0)
+        self.structure_ok = self.structure_score >= STRUCTURE_OK_THRESHOLD
+        self.personalization_ok = self.personalization_score >= PERSONALIZATION_OK_THRESHOLD
+        self.message_ok = self.message_score >= MESSAGE_OK_THRESHOLD
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'QualityScore':
+        """Rebuild a QualityScore from its asdict() form (derived fields are recomputed)."""
+        return cls(**{f.name: data[f.name] for f in fields(cls) if f.init})
     
 
 class EmailQualityValidator:
@@ -31,17 +56,77 @@ class EmailQualityValidator:
     - Selling Intent Compliance: 15 points (CRITICAL)
     """
     
-    def __init__(self):
-        self.keboola_use_cases = {
-            'financial': {'metric': '70% reduction in FP&A reporting time', 'customer': 'Home Credit'},
-            'retail': {'metric': '80% reduction in manual data processing', 'customer': 'Rohlik'},
-            'logistics': {'metric': 'unified data across 8 countries', 'customer': 'P3 Logistic Parks'},
-            'manufacturing': {'metric': '50% reduction in data tool costs', 'customer': 'manufacturing clients'},
-            'technology': {'metric': 'launch analytics projects in days vs months', 'customer': 'tech companies'}
-        }
+    # Keyword tables and compiled patterns are built once at class creation
+    keboola_use_cases = {
+        'financial': {'metric': '70% reduction in FP&A reporting time', 'customer': 'Home Credit'},
+        'retail': {'metric': '80% reduction in manual data processing', 'customer': 'Rohlik'},
+        'logistics': {'metric': 'unified data across 8 countries', 'customer': 'P3 Logistic Parks'},
+        'manufacturing': {'metric': '50% reduction in data tool costs', 'customer': 'manufacturing clients'},
+        'technology': {'metric': 'launch analytics projects in days vs months', 'customer': 'tech companies'}
+    }
+    
+    CRM_TERMS = ('customer', 'segmentation', 'lead scoring')
+    SUPPLY_CHAIN_TERMS = ('supply chain', 'logistics', 'inventory')
+    SUPPLY_CHAIN_VALUE_TERMS = ('optimization', 'visibility', 'tracking')
+    GENERIC_MESSAGING_TERMS = ('generic data', 'data transformation', 'analytics platform')
+    ACHIEVEMENT_KEYWORDS = ('congratulations', 'impressive', 'notable', 'achievement', 'success', 'proud', 'recognized')
+    KEBOOLA_CUSTOMERS = ('home credit', 'rohlik', 'p3 logistic', 'brix')
+    INDUSTRY_METRICS = ('70%', '80%', '50%', 'reduction', 'unified data', 'days vs months')
+    DATA_KEYWORDS = ('data platform', 'data stack', 'data operations', 'analytics')
+    VALUE_KEYWORDS = ('help you', 'achieve similar', 'opportunities', 'optimize', 'streamline')
+    GENERIC_VALUE = ('data costs', 'efficiency', 'operations', 'similar results')
+    
+    # Strong assumptive CTAs (5 points)
+    STRONG_CTA_PATTERNS = tuple(re.compile(pattern) for pattern in (
+        r'when.{1,30}best time',
+        r'are you free.{1,30}for',
+        r'what.{1,10}your availability',
+        r'when can we',
+        r'when works better',
+        r'should we schedule'
+    ))
+    # Weak permission-seeking CTAs (3 points)
+    WEAK_CTA_PATTERNS = tuple(re.compile(pattern) for pattern in (
+        r'would you be open to',
+        r'are you interested in',
+        r'would you like to',
+        r'can we set up'
+    ))
+    # Basic meeting mention (2 points)
+    BASIC_CTA_PATTERNS = tuple(re.compile(pattern) for pattern in (
+        r'15[-\s]?minute call',
+        r'brief call',
+        r'quick call',
+        r'meeting',
+        r'discuss',
+        r'demo'
+    ))
+    
+    TECHNICAL_ROLES = ('cto', 'engineer', 'developer', 'architect', 'technical', 'data')
+    BUSINESS_ROLES = ('ceo', 'cmo', 'vp', 'director', 'manager', 'head')
+    TECHNICAL_KEYWORDS = ('technical', 'integration', 'api', 'automation', 'platform')
+    BUSINESS_KEYWORDS = ('business', 'roi', 'efficiency', 'costs', 'revenue')
+    ROLE_KEYWORDS = TECHNICAL_KEYWORDS + BUSINESS_KEYWORDS
+    
+    GREETING_RE = re.compile(r'Hi [A-Z][a-z]+,')
+    CLOSING_RE = re.compile(r'Best regards|Best|Regards|Sincerely')
+    TRANSITION_WORDS = ('given', 'since', 'because', 'therefore', 'recently', 'we helped')
+    CONVERSATIONAL_PHRASES = ('I believe', 'would you', 'I noticed', 'given your')
+    SUBJECT_VALUE_WORDS = ('50%', '70%', '80%', 'cut costs', 'reduce', 'data')
     
     def validate_email(self, email_content: str, research_data: Dict, inputs: Dict) -> QualityScore:
         """Main validation function that calculates total quality score."""
+        return self.validate_email_batch([(email_content, research_data, inputs)])[0]
+    
+    def validate_email_batch(self, items: List[Tuple[str, Dict, Dict]]) -> List[QualityScore]:
+        """Validate a batch of (email_content, research_data, inputs) tuples in one call."""
+        return [self._score_email(email_content, research_data, inputs) for email_content, research_data, inputs in items]
+    
+    def _score_email(self, email_content: str, research_data: Dict, inputs: Dict) -> QualityScore:
+        """Calculate total quality score for a single email."""
+        
+        if len(email_content) < MIN_EMAIL_LENGTH:
+            return self._fast_fail_score()
         
         structure_score = self._check_structure_compliance(email_content, research_data, inputs)
         personalization_score = self._check_personalization_quality(email_content, research_data, inputs)
@@ -66,6 +151,23 @@ class EmailQualityValidator:
             details=details
         )
     
+    def _fast_fail_score(self) -> QualityScore:
+        """Zero score for degenerate emails, keeping the per-category details layout."""
+        details = {
+            category: {'total': 0, 'details': {}}
+            for category in ('structure', 'personalization', 'message', 'selling_intent')
+        }
+        details['fast_fail'] = True
+        
+        return QualityScore(
+            total_score=0,
+            structure_score=0,
+            personalization_score=0,
+            message_score=0,
+            intent_score=0,
+            details=details
+        )
+    
     def _check_structure_compliance(self, email: str, research_data: Dict, inputs: Dict) -> Dict:
         """Structure Compliance: 35 points total"""
         score_details = {}
@@ -165,11 +267,11 @@ class EmailQualityValidator:
             score_details['keyword_coverage'] = 15  # Full points for no specific requirements
             return {'total': 15, 'details': score_details}
         
-        # Extract intent keywords
+        # Extract intent keywords and scan the email for them once for all checks below
         intent_keywords = [word for word in selling_intent.split() if len(word) > 2]  # Skip short words
+        keywords_found = sum(1 for keyword in intent_keywords if keyword in email_lower)
         
         # 1. Keyword Coverage (8 points)
-        keywords_found = sum(1 for keyword in intent_keywords if keyword in email_lower)
         keyword_coverage = keywords_found / len(intent_keywords) if intent_keywords else 0
         
         if keyword_coverage >= 0.8:  # 80% of keywords present
@@ -190,25 +292,17 @@ class EmailQualityValidator:
         use_case_score = 0
         # Dynamic scoring based on selling_intent keywords
         if selling_intent:
-            # Extract meaningful keywords from selling_intent
-            intent_keywords = [word for word in selling_intent.split() if len(word) > 2]
-            
-            # Count how many intent keywords appear in the email
-            keywords_found = sum(1 for keyword in intent_keywords if keyword in email_lower)
-            
-            # Score based on keyword coverage
-            if intent_keywords:
-                coverage_ratio = keywords_found / len(intent_keywords)
-                use_case_score = int(5 * coverage_ratio)  # Up to 5 points based on coverage
+            # Score based on the keyword coverage computed above
+            use_case_score = int(5 * keyword_coverage)  # Up to 5 points based on coverage
         elif 'crm' in selling_intent:
             if 'crm' in email_lower:
                 use_case_score += 3
-            if any(term in email_lower for term in ['customer', 'segmentation', 'lead scoring']):
+            if any(term in email_lower for term in self.CRM_TERMS):
                 use_case_score += 2
         elif 'supply chain' in selling_intent:
-            if any(term in email_lower for term in ['supply chain', 'logistics', 'inventory']):
+            if any(term in email_lower for term in self.SUPPLY_CHAIN_TERMS):
                 use_case_score += 3
-            if any(term in email_lower for term in ['optimization', 'visibility', 'tracking']):
+            if any(term in email_lower for term in self.SUPPLY_CHAIN_VALUE_TERMS):
                 use_case_score += 2
         else:
             # Generic intent - check for relevant business context
@@ -222,12 +316,11 @@ class EmailQualityValidator:
         generic_penalty = 0
         if selling_intent:
             # Strong penalty for generic data platform messaging when specific intent provided
-            intent_keywords = [word for word in selling_intent.split() if len(word) > 2]
-            has_intent_keyword = any(keyword in email_lower for keyword in intent_keywords)
+            has_intent_keyword = keywords_found > 0
             
             if 'data platform' in email_lower and not has_intent_keyword:
                 generic_penalty = -3
-            elif any(term in email_lower for term in ['generic data', 'data transformation', 'analytics platform']) and not has_intent_keyword:
+            elif any(term in email_lower for term in self.GENERIC_MESSAGING_TERMS) and not has_intent_keyword:
                 generic_penalty = -2
         
         score_details['generic_penalty'] = generic_penalty
@@ -242,8 +335,7 @@ class EmailQualityValidator:
         """Check if email contains achievement recognition (10 points)"""
         achievements = research_data.get('achievements', [])
         linkedin_confidence = research_data.get('linkedin_confidence', 0)
-        
-        achievement_keywords = ['congratulations', 'impressive', 'notable', 'achievement', 'success', 'proud', 'recognized']
+        achievement_keywords = self.ACHIEVEMENT_KEYWORDS
         
         if linkedin_confidence >= 70:
             # Should have specific achievement
@@ -263,18 +355,15 @@ class EmailQualityValidator:
         company = inputs.get('company', '').lower()
         
         # Check for Keboola customer mentions
-        keboola_customers = ['home credit', 'rohlik', 'p3 logistic', 'brix']
-        if any(customer in email.lower() for customer in keboola_customers):
+        if any(customer in email.lower() for customer in self.KEBOOLA_CUSTOMERS):
             return 10
         
         # Check for industry-specific metrics
-        industry_metrics = ['70%', '80%', '50%', 'reduction', 'unified data', 'days vs months']
-        if any(metric in email.lower() for metric in industry_metrics):
+        if any(metric in email.lower() for metric in self.INDUSTRY_METRICS):
             return 8
         
         # Generic data platform mention
-        data_keywords = ['data platform', 'data stack', 'data operations', 'analytics']
-        if any(keyword in email.lower() for keyword in data_keywords):
+        if any(keyword in email.lower() for keyword in self.DATA_KEYWORDS):
             return 5
         
         return 0
@@ -285,53 +374,24 @@ class EmailQualityValidator:
         
         # Company-specific value prop
         if company.lower() in email.lower():
-            value_keywords = ['help you', 'achieve similar', 'opportunities', 'optimize', 'streamline']
-            if any(keyword in email.lower() for keyword in value_keywords):
+            if any(keyword in email.lower() for keyword in self.VALUE_KEYWORDS):
                 return 10
         
         # Generic but relevant value prop
-        generic_value = ['data costs', 'efficiency', 'operations', 'similar results']
-        if any(keyword in email.lower() for keyword in generic_value):
+        if any(keyword in email.lower() for keyword in self.GENERIC_VALUE):
             return 6
         
         return 0
     
     def _check_call_to_action(self, email: str) -> int:
         """Check for clear meeting request CTA (5 points)"""
+        email_lower = email.lower()
         
-        # Strong assumptive CTAs (5 points)
-        strong_cta_patterns = [
-            r'when.{1,30}best time',
-            r'are you free.{1,30}for',
-            r'what.{1,10}your availability',
-            r'when can we',
-            r'when works better',
-            r'should we schedule'
-        ]
-        
-        # Weak permission-seeking CTAs (3 points)  
-        weak_cta_patterns = [
-            r'would you be open to',
-            r'are you interested in',
-            r'would you like to',
-            r'can we set up'
-        ]
-        
-        # Basic meeting mention (2 points)
-        basic_cta_patterns = [
-            r'15[-\s]?minute call',
-            r'brief call',
-            r'quick call',
-            r'meeting',
-            r'discuss',
-            r'demo'
-        ]
-        
-        if any(re.search(pattern, email.lower()) for pattern in strong_cta_patterns):
+        if any(pattern.search(email_lower) for pattern in self.STRONG_CTA_PATTERNS):
             return 5  # Strong assumptive CTA
-        elif any(re.search(pattern, email.lower()) for pattern in weak_cta_patterns):
+        elif any(pattern.search(email_lower) for pattern in self.WEAK_CTA_PATTERNS):
             return 3  # Weak permission-seeking CTA  
-        elif any(re.search(pattern, email.lower()) for pattern in basic_cta_patterns):
+        elif any(pattern.search(email_lower) for pattern in self.BASIC_CTA_PATTERNS):
             return 2  # Basic CTA mention
         
         return 0  # No CTA found
@@ -352,21 +412,15 @@ class EmailQualityValidator:
         """Check if messaging matches role type (5 points)"""
         title = inputs.get('title', '').lower()
         
-        technical_roles = ['cto', 'engineer', 'developer', 'architect', 'technical', 'data']
-        business_roles = ['ceo', 'cmo', 'vp', 'director', 'manager', 'head']
-        
-        technical_keywords = ['technical', 'integration', 'api', 'automation', 'platform']
-        business_keywords = ['business', 'roi', 'efficiency', 'costs', 'revenue']
-        
-        if any(role in title for role in technical_roles):
-            if any(keyword in email.lower() for keyword in technical_keywords):
+        if any(role in title for role in self.TECHNICAL_ROLES):
+            if any(keyword in email.lower() for keyword in self.TECHNICAL_KEYWORDS):
                 return 5
-        elif any(role in title for role in business_roles):
-            if any(keyword in email.lower() for keyword in business_keywords):
+        elif any(role in title for role in self.BUSINESS_ROLES):
+            if any(keyword in email.lower() for keyword in self.BUSINESS_KEYWORDS):
                 return 5
         else:
             # Generic role - accept either approach
-            if any(keyword in email.lower() for keyword in technical_keywords + business_keywords):
+            if any(keyword in email.lower() for keyword in self.ROLE_KEYWORDS):
                 return 4
         
         return 2  # Default for reasonable messaging
@@ -376,21 +430,19 @@ class EmailQualityValidator:
         score = 0
         
         # Professional greeting
-        if re.search(r'Hi [A-Z][a-z]+,', email):
+        if self.GREETING_RE.search(email):
             score += 3
         
         # Smooth transitions
-        transition_words = ['given', 'since', 'because', 'therefore', 'recently', 'we helped']
-        if any(word in email.lower() for word in transition_words):
+        if any(word in email.lower() for word in self.TRANSITION_WORDS):
             score += 4
         
         # Professional closing
-        if re.search(r'Best regards|Best|Regards|Sincerely', email):
+        if self.CLOSING_RE.search(email):
             score += 3
         
         # Conversational but professional tone
-        conversational = ['I believe', 'would you', 'I noticed', 'given your']
-        if any(phrase in email.lower() for phrase in conversational):
+        if any(phrase in email.lower() for phrase in self.CONVERSATIONAL_PHRASES):
             score += 5
         
         return min(score, 15)
@@ -442,8 +494,7 @@ class EmailQualityValidator:
             score += 1
         
         # Value proposition in subject
-        value_words = ['50%', '70%', '80%', 'cut costs', 'reduce', 'data']
-        if any(word in subject_line.lower() for word in value_words):
+        if any(word in subject_line.lower() for word in self.SUBJECT_VALUE_WORDS):
             score += 2
         
         return min(score, 5)
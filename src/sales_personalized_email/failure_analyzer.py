@@ -149,7 +149,7 @@ class FailureAnalyzer:
         # Pattern 2: Personalization failures
         personalization_failures = [
             f for f in failures
-            if f.quality_score and f.quality_score.personalization_score < 20
+            if f.quality_score and not f.quality_score.personalization_ok
         ]
         if personalization_failures:
             patterns.append(FailurePattern(
@@ -166,7 +166,7 @@ class FailureAnalyzer:
         # Pattern 3: Structure failures
         structure_failures = [
             f for f in failures
-            if f.quality_score and f.quality_score.structure_score < 28
+            if f.quality_score and not f.quality_score.structure_ok
         ]
         if structure_failures:
             patterns.append(FailurePattern(
@@ -183,7 +183,7 @@ class FailureAnalyzer:
         # Pattern 4: Message quality failures
         message_failures = [
             f for f in failures
-            if f.quality_score and f.quality_score.message_score < 20
+            if f.quality_score and not f.quality_score.message_ok
         ]
         if message_failures:
             patterns.append(FailurePattern(
@@ -6,20 +6,63 @@ Executes crew with test prospects and validates outputs against quality criteria
 Provides detailed pass/fail analysis with 95% pass rate target.
 """
 
+import asyncio
 import subprocess
 import json
+import hashlib
 import tempfile
+import shutil
 import os
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from collections import Counter
+from typing import Callable, List, Dict, Iterable, Iterator, Optional, Tuple
+from array import array
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
 from sales_personalized_email.email_quality_validator import (
     EmailQualityValidator,
     QualityScore
 )
 
 
+# tmpfs root for throwaway crew files (input JSON, TMPDIR of the subprocess) -
+# each suite gets its own directory under it
+TMPFS_ROOT = '/dev/shm'
+
+# Success ledger for skipping known passes across suite runs
+LEDGER_PATH = os.path.join('.test_cache', 'ledger.json')
+PROMPT_FILES = tuple(
+    os.path.join(os.path.dirname(__file__), 'config', name)
+    for name in ('agents.yaml', 'tasks.yaml')
+)
+
+# Critical failure message marker -> failure pattern name
+CRITICAL_FAILURE_PATTERNS = (
+    ('Intent compliance', 'critical_intent_failure'),
+    ('First name', 'capitalization_error'),
+    ('call-to-action', 'missing_cta'),
+    ('Generic messaging', 'generic_messaging'),
+)
+
+
 @dataclass
 class TestResult:
     """Single test execution result"""
@@ -31,6 +74,15 @@ class TestResult:
     execution_time: float
     error: Optional[str] = None
 
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TestResult':
+        """Rebuild a TestResult from its asdict() form"""
+        quality_score = data.get('quality_score')
+        return cls(**{
+            **data,
+            'quality_score': QualityScore.from_dict(quality_score) if quality_score else None
+        })
+
 
 @dataclass
 class TestSuiteResults:
@@ -43,6 +95,7 @@ class TestSuiteResults:
     results: List[TestResult]
     failure_patterns: Dict[str, int]
     timestamp: str
+    results_path: Optional[str] = None  # JSONL file when results were streamed to disk
 
     @property
     def num_failures(self) -> int:
@@ -50,7 +103,110 @@ class TestSuiteResults:
 
     @property
     def failures(self) -> List[TestResult]:
-        return [r for r in self.results if not r.passed]
+        return [r for r in self.iter_results() if not r.passed]
+
+    def iter_results(self) -> Iterator[TestResult]:
+        """Iterate results from memory, or re-read them from results_path"""
+        if self.results_path:
+            return _read_results(self.results_path)
+        return iter(self.results)
+
+
+@dataclass
+class SuiteAggregates:
+    """Parallel per-test buffers used for suite summary math"""
+    passed: array = field(default_factory=lambda: array('b'))
+    scores: array = field(default_factory=lambda: array('d'))  # Only tests with a quality score
+
+    def add(self, result: TestResult):
+        self.passed.append(result.passed)
+        if result.quality_score:
+            self.scores.append(result.quality_score.total_score)
+
+
+class SuccessLedger:
+    """
+    Persistent record of prospect outcomes per prompt version.
+
+    Prospects that passed with a high score under unchanged prompts are
+    very likely to pass again, so suite runs can reuse their results.
+    """
+
+    def __init__(
+        self,
+        ledger_path: str = LEDGER_PATH,
+        prompt_files: Tuple[str, ...] = PROMPT_FILES,
+        min_score: int = 95
+    ):
+        self.ledger_path = ledger_path
+        self.min_score = min_score
+        self.prompt_hash = self._hash_prompts(prompt_files)
+        self.entries = self._load()
+
+    def known_pass(self, prospect_input: Dict) -> Optional[TestResult]:
+        """
+        Get synthetic result for a prospect that already passed.
+
+        Args:
+            prospect_input: Prospect data
+
+        Returns:
+            TestResult rebuilt from the ledger or None if the prospect must run
+        """
+
+        entry = self.entries.get(self._key(prospect_input))
+        if not entry or not entry['passed'] or entry['quality_score']['total_score'] < self.min_score:
+            return None
+
+        return TestResult(
+            prospect_input=prospect_input,
+            passed=True,
+            quality_score=QualityScore.from_dict(entry['quality_score']),
+            output=None,
+            critical_failures=[],
+            execution_time=0.0
+        )
+
+    def record(self, result: TestResult):
+        """Record outcome of a fresh test run"""
+        if result.quality_score is None:
+            return
+
+        self.entries[self._key(result.prospect_input)] = {
+            'passed': result.passed,
+            'quality_score': asdict(result.quality_score)
+        }
+
+    def save(self):
+        """Persist ledger to disk"""
+        os.makedirs(os.path.dirname(self.ledger_path) or '.', exist_ok=True)
+        with open(self.ledger_path, 'w') as f:
+            json.dump(self.entries, f)
+
+    def _key(self, prospect_input: Dict) -> str:
+        prospect_id = hashlib.blake2b(
+            json.dumps(prospect_input, sort_keys=True).encode('utf-8'),
+            digest_size=8
+        ).hexdigest()
+        return f"{prospect_id}:{self.prompt_hash}"
+
+    def _hash_prompts(self, prompt_files: Tuple[str, ...]) -> str:
+        digest = hashlib.blake2b(digest_size=8)
+        for path in prompt_files:
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        return digest.hexdigest()
+
+    def _load(self) -> Dict:
+        if not os.path.exists(self.ledger_path):
+            return {}
+
+        try:
+            with open(self.ledger_path) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"  ⚠️  Ignoring unreadable ledger {self.ledger_path}: {e}")
+            return {}
 
 
 class CrewTestRunner:
@@ -69,6 +225,7 @@ class CrewTestRunner:
         self.crew_command = crew_command
         self.validator = EmailQualityValidator()
         self.quality_threshold = 85
+        self.scratch_dir: Optional[str] = None
 
     def run_single_test(
         self,
@@ -87,60 +244,43 @@ class CrewTestRunner:
             TestResult with pass/fail and detailed metrics
         """
 
-        start_time = datetime.now()
+        start_time = time.perf_counter()
 
         try:
+            # Tokenize selling intent once per prospect
+            intent_ctx = self._build_intent_context(prospect_input)
+
             # Execute crew
             output = self._execute_crew(prospect_input, timeout)
 
             if output is None:
-                return TestResult(
-                    prospect_input=prospect_input,
-                    passed=False,
-                    quality_score=None,
-                    output=None,
-                    critical_failures=["Crew execution failed"],
-                    execution_time=(datetime.now() - start_time).total_seconds(),
-                    error="Crew execution failed or returned no output"
+                return self._crew_failure_result(
+                    prospect_input, time.perf_counter() - start_time
                 )
 
             # Validate output
             quality_score = self._validate_output(output, prospect_input)
 
-            # Check critical failures
-            critical_failures = self._check_critical_failures(
-                output, prospect_input, quality_score
-            )
-
-            # Determine pass/fail
-            passed = len(critical_failures) == 0 and quality_score.total_score >= self.quality_threshold
-
-            execution_time = (datetime.now() - start_time).total_seconds()
-
-            return TestResult(
-                prospect_input=prospect_input,
-                passed=passed,
-                quality_score=quality_score,
-                output=output,
-                critical_failures=critical_failures,
-                execution_time=execution_time
+            return self._build_result(
+                prospect_input,
+                output,
+                quality_score,
+                intent_ctx,
+                time.perf_counter() - start_time
             )
 
         except Exception as e:
-            return TestResult(
-                prospect_input=prospect_input,
-                passed=False,
-                quality_score=None,
-                output=None,
-                critical_failures=[f"Exception: {str(e)}"],
-                execution_time=(datetime.now() - start_time).total_seconds(),
-                error=str(e)
+            return self._exception_result(
+                prospect_input, e, time.perf_counter() - start_time
             )
 
     def run_test_suite(
         self,
         prospects: List[Dict],
-        target_pass_rate: float = 0.95
+        target_pass_rate: float = 0.95,
+        max_workers: int = 1,
+        results_path: Optional[str] = None,
+        skip_known_pass: bool = False
     ) -> TestSuiteResults:
         """
         Run all prospects and aggregate results.
@@ -148,51 +288,270 @@ class CrewTestRunner:
         Args:
             prospects: List of prospect dictionaries
             target_pass_rate: Target pass rate (default: 0.95)
+            max_workers: Worker processes to shard prospects across
+                (default: 1 - run sequentially in this process)
+            results_path: Stream each TestResult to this JSONL file instead of
+                keeping them in memory (default: None - keep in memory)
+            skip_known_pass: Reuse ledger results for prospects that already
+                passed with a score >= 95 under the current prompts (default: False)
 
         Returns:
             TestSuiteResults with comprehensive analysis
         """
 
-        print(f"\n🚀 Running test suite with {len(prospects)} prospects")
-        print(f"   Target pass rate: {target_pass_rate*100:.0f}%")
-        print(f"   Quality threshold: {self.quality_threshold}/100")
-        print("=" * 70)
+        self._print_suite_header(prospects, target_pass_rate)
 
         results = []
+        aggregates = SuiteAggregates()
+        sink = open(results_path, 'wb', buffering=1 << 20) if results_path else None
+
+        def collect(result: TestResult):
+            aggregates.add(result)
+            if sink:
+                sink.write(_json_dumps(asdict(result)) + b'\n')
+            else:
+                results.append(result)
+
+        ledger = SuccessLedger() if skip_known_pass else None
+
+        try:
+            self._create_scratch_dir()
+
+            if ledger:
+                to_run = []
+                for prospect in prospects:
+                    cached = ledger.known_pass(prospect)
+                    if cached:
+                        collect(cached)
+                    else:
+                        to_run.append(prospect)
+                print(f"   Skipping {len(prospects) - len(to_run)} known passes (prompt hash {ledger.prompt_hash})")
+                prospects = to_run
+
+            for result in self._iter_results(prospects, max_workers):
+                self._print_result(result)
+                collect(result)
+                if ledger:
+                    ledger.record(result)
+        finally:
+            if sink:
+                sink.close()
+            if ledger:
+                ledger.save()
+            # Scratch files are only needed while crews run - clean once per suite
+            self._cleanup_scratch_dir()
+
+        return self._summarize_results(results, aggregates, target_pass_rate, results_path)
+
+    async def run_test_suite_async(
+        self,
+        prospects: List[Dict],
+        target_pass_rate: float = 0.95,
+        concurrency: int = 10,
+        max_retries: int = 1
+    ) -> TestSuiteResults:
+        """
+        Run prospects concurrently from a queue, retrying transient failures early.
+
+        Workers pull prospects from an asyncio.Queue and run each test on a
+        suite-owned thread pool sized to concurrency (the loop's default
+        executor is capped by CPU count). Tests that fail without producing a quality score (crew
+        execution error, timeout, exception) are pushed back onto the queue
+        right away instead of waiting for the rest of the suite.
+
+        Args:
+            prospects: List of prospect dictionaries
+            target_pass_rate: Target pass rate (default: 0.95)
+            concurrency: Number of crews running at once - bounds LLM API load (default: 10)
+            max_retries: Retries per prospect for transient failures (default: 1)
+
+        Returns:
+            TestSuiteResults with results in input order
+        """
+
+        self._print_suite_header(prospects, target_pass_rate)
+        print(f"   Concurrency: {concurrency} crews, max retries: {max_retries}")
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, prospect in enumerate(prospects):
+            queue.put_nowait((index, prospect, 0))
+
+        results: List[Optional[TestResult]] = [None] * len(prospects)
+        completed = 0
+
+        num_workers = max(1, min(concurrency, len(prospects)))
+        executor = ThreadPoolExecutor(max_workers=num_workers)
+        loop = asyncio.get_running_loop()
+
+        async def worker():
+            nonlocal completed
+            while True:
+                index, prospect, attempt = await queue.get()
+                try:
+                    start_time = time.perf_counter()
+                    try:
+                        result = await loop.run_in_executor(executor, self.run_single_test, prospect)
+                    except Exception as e:
+                        result = self._exception_result(
+                            prospect, e, time.perf_counter() - start_time
+                        )
+
+                    if result.quality_score is None and attempt < max_retries:
+                        print(f"\n🔁 Retrying: {prospect['first_name']} {prospect['last_name']} at {prospect['company']} ({result.error})")
+                        queue.put_nowait((index, prospect, attempt + 1))
+                        continue
+
+                    completed += 1
+                    print(f"\n[{completed}/{len(prospects)}] Tested: {prospect['first_name']} {prospect['last_name']} at {prospect['company']}")
+                    self._print_result(result)
+                    results[index] = result
+                finally:
+                    queue.task_done()
+
+        # Create the scratch directory up front so worker threads share one
+        self._create_scratch_dir()
+        workers = [asyncio.create_task(worker()) for _ in range(num_workers)]
+
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._cleanup_scratch_dir()
+
+        aggregates = SuiteAggregates()
+        for result in results:
+            aggregates.add(result)
+
+        return self._summarize_results(results, aggregates, target_pass_rate)
+
+    def run_test_suite_batched(
+        self,
+        prospects: List[Dict],
+        target_pass_rate: float = 0.95,
+        timeout: int = 180
+    ) -> TestSuiteResults:
+        """
+        Run all crews first, then validate every output in a single batch.
+
+        Execution time per result covers the crew run only, since validation
+        is shared across the whole batch.
+
+        Args:
+            prospects: List of prospect dictionaries
+            target_pass_rate: Target pass rate (default: 0.95)
+            timeout: Execution timeout per crew run in seconds (default: 180)
+
+        Returns:
+            TestSuiteResults with comprehensive analysis
+        """
+
+        self._print_suite_header(prospects, target_pass_rate)
 
-        for i, prospect in enumerate(prospects, 1):
-            print(f"\n[{i}/{len(prospects)}] Testing: {prospect['first_name']} {prospect['last_name']} at {prospect['company']}")
+        crew_runs = []
 
-            result = self.run_single_test(prospect)
+        try:
+            self._create_scratch_dir()
+
+            for i, prospect in enumerate(prospects, 1):
+                print(f"\n[{i}/{len(prospects)}] Running crew: {prospect['first_name']} {prospect['last_name']} at {prospect['company']}")
+
+                start_time = time.perf_counter()
+                output = self._execute_crew(prospect, timeout)
+                crew_runs.append((prospect, output, time.perf_counter() - start_time))
+        finally:
+            self._cleanup_scratch_dir()
 
-            if result.passed:
-                print(f"  ✅ PASS - Score: {result.quality_score.total_score}/100")
+        # Validate all crew outputs in one call
+        completed = [(prospect, output) for prospect, output, _ in crew_runs if output is not None]
+        print(f"\n🔎 Validating {len(completed)} crew outputs...")
+        quality_scores = iter(self.validator.validate_email_batch([
+            self._build_validation_input(output, prospect)
+            for prospect, output in completed
+        ]))
+
+        results = []
+        aggregates = SuiteAggregates()
+
+        for prospect, output, execution_time in crew_runs:
+            if output is None:
+                result = self._crew_failure_result(prospect, execution_time)
             else:
-                print(f"  ❌ FAIL - Score: {result.quality_score.total_score if result.quality_score else 'N/A'}/100")
-                if result.critical_failures:
-                    print(f"  ⚠️  Critical failures:")
-                    for failure in result.critical_failures[:3]:  # Show top 3
-                        print(f"     - {failure}")
+                result = self._build_result(
+                    prospect,
+                    output,
+                    next(quality_scores),
+                    self._build_intent_context(prospect),
+                    execution_time
+                )
 
+            print(f"\nResult: {prospect['first_name']} {prospect['last_name']} at {prospect['company']}")
+            self._print_result(result)
             results.append(result)
+            aggregates.add(result)
+
+        return self._summarize_results(results, aggregates, target_pass_rate)
+
+    def _print_suite_header(self, prospects: List[Dict], target_pass_rate: float):
+        """Print test suite configuration"""
+        print(f"\n🚀 Running test suite with {len(prospects)} prospects")
+        print(f"   Target pass rate: {target_pass_rate*100:.0f}%")
+        print(f"   Quality threshold: {self.quality_threshold}/100")
+        print("=" * 70)
+
+    def _print_result(self, result: TestResult):
+        """Print pass/fail line and top critical failures for a result"""
+        if result.passed:
+            print(f"  ✅ PASS - Score: {result.quality_score.total_score}/100")
+        else:
+            print(f"  ❌ FAIL - Score: {result.quality_score.total_score if result.quality_score else 'N/A'}/100")
+            if result.critical_failures:
+                print(f"  ⚠️  Critical failures:")
+                for failure in result.critical_failures[:3]:  # Show top 3
+                    print(f"     - {failure}")
+
+    def _summarize_results(
+        self,
+        results: List[TestResult],
+        aggregates: SuiteAggregates,
+        target_pass_rate: float,
+        results_path: Optional[str] = None
+    ) -> TestSuiteResults:
+        """
+        Aggregate and print suite-level metrics.
+
+        Args:
+            results: Test results kept in memory (empty when streamed)
+            aggregates: Per-test pass flags and scores collected alongside results
+            target_pass_rate: Target pass rate
+            results_path: JSONL file results were streamed to, if any
+
+        Returns:
+            TestSuiteResults with comprehensive analysis
+        """
 
         # Calculate aggregate metrics
-        passed_tests = sum(1 for r in results if r.passed)
-        failed_tests = len(results) - passed_tests
-        pass_rate = passed_tests / len(results) if results else 0.0
+        total_tests = len(aggregates.passed)
+        passed_tests = sum(aggregates.passed)
+        failed_tests = total_tests - passed_tests
+        pass_rate = passed_tests / total_tests if total_tests else 0.0
 
         # Calculate average quality score
-        quality_scores = [r.quality_score.total_score for r in results if r.quality_score]
+        quality_scores = aggregates.scores
         avg_quality_score = sum(quality_scores) / len(quality_scores) if quality_scores else 0.0
 
         # Analyze failure patterns
-        failure_patterns = self._analyze_failure_patterns(results)
+        failure_patterns = self._analyze_failure_patterns(
+            _read_results(results_path) if results_path else results
+        )
 
         # Print summary
         print("\n" + "=" * 70)
         print("📊 TEST SUITE SUMMARY")
         print("=" * 70)
-        print(f"Total tests: {len(results)}")
+        print(f"Total tests: {total_tests}")
         print(f"Passed: {passed_tests} ✅")
         print(f"Failed: {failed_tests} ❌")
         print(f"Pass rate: {pass_rate*100:.1f}% (Target: {target_pass_rate*100:.0f}%)")
@@ -210,16 +569,53 @@ class CrewTestRunner:
             print(f"   - {pattern}: {count}/{failed_tests} ({percentage:.0f}%)")
 
         return TestSuiteResults(
-            total_tests=len(results),
+            total_tests=total_tests,
             passed_tests=passed_tests,
             failed_tests=failed_tests,
             pass_rate=pass_rate,
             avg_quality_score=avg_quality_score,
             results=results,
             failure_patterns=failure_patterns,
-            timestamp=datetime.now().isoformat()
+            timestamp=datetime.now().isoformat(),
+            results_path=results_path
         )
 
+    def _iter_results(
+        self,
+        prospects: List[Dict],
+        max_workers: int
+    ) -> Iterator[TestResult]:
+        """
+        Run prospects sequentially or sharded across worker processes.
+
+        Args:
+            prospects: List of prospect dictionaries
+            max_workers: Number of worker processes (<= 1 runs in-process)
+
+        Yields:
+            TestResult per prospect, in input order
+        """
+
+        total = len(prospects)
+
+        if max_workers <= 1:
+            for i, prospect in enumerate(prospects, 1):
+                print(f"\n[{i}/{total}] Testing: {prospect['first_name']} {prospect['last_name']} at {prospect['company']}")
+                yield self.run_single_test(prospect)
+            return
+
+        print(f"   Workers: {max_workers} processes")
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.crew_command, self.scratch_dir)
+        ) as executor:
+            # chunksize=1 - each crew run takes minutes, so balance load per prospect
+            for i, (prospect, result) in enumerate(zip(prospects, executor.map(_run_one, prospects)), 1):
+                print(f"\n[{i}/{total}] Tested: {prospect['first_name']} {prospect['last_name']} at {prospect['company']}")
+                yield result
+
     def _execute_crew(
         self,
         prospect_input: Dict,
@@ -236,8 +632,17 @@ class CrewTestRunner:
             Parsed crew output or None if failed
         """
 
+        # Keep transient writes on the suite's tmpfs scratch directory, if any
+        scratch_dir = self.scratch_dir
+        env = os.environ.copy()
+        # Quiet crew logging - only the final output is parsed
+        env.update({'CREWAI_VERBOSE': '0', 'LITELLM_LOG': 'ERROR'})
+        env.pop('PYTHONUNBUFFERED', None)
+        if scratch_dir:
+            env['TMPDIR'] = scratch_dir
+
         # Create temporary input file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False, dir=scratch_dir) as f:
             json.dump(prospect_input, f)
             input_file = f.name
 
@@ -270,7 +675,8 @@ class CrewTestRunner:
                 capture_output=True,
                 text=True,
                 timeout=timeout,
-                cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+                cwd=os.path.dirname(os.path.dirname(os.path.dirname(__file__))),
+                env=env
             )
 
             # Parse output
@@ -288,6 +694,32 @@ class CrewTestRunner:
             if os.path.exists(input_file):
                 os.unlink(input_file)
 
+    def _create_scratch_dir(self) -> Optional[str]:
+        """
+        Create this suite's private tmpfs scratch directory for transient crew files.
+
+        Only the run_test_suite* methods call this, and they remove the directory
+        when the suite finishes - a direct run_single_test call uses the default
+        temp location, so it never leaves a tmpfs directory behind.
+
+        Returns:
+            Scratch directory path or None if tmpfs is not available
+        """
+
+        if self.scratch_dir is None and os.path.isdir(TMPFS_ROOT):
+            try:
+                self.scratch_dir = tempfile.mkdtemp(prefix='crew_tmp_', dir=TMPFS_ROOT)
+            except OSError:
+                return None
+
+        return self.scratch_dir
+
+    def _cleanup_scratch_dir(self):
+        """Remove this suite's tmpfs scratch directory after the suite finishes"""
+        if self.scratch_dir is not None:
+            shutil.rmtree(self.scratch_dir, ignore_errors=True)
+            self.scratch_dir = None
+
     def _parse_crew_output(self, stdout: str) -> Optional[Dict]:
         """
         Parse crew output to extract PersonalizedEmail result.
@@ -315,7 +747,7 @@ class CrewTestRunner:
                     break
 
             if json_str:
-                return json.loads(json_str)
+                return _json_loads(json_str)
 
             # Alternative: Look for structured output markers
             output_dict = {}
@@ -339,6 +771,78 @@ class CrewTestRunner:
             print(f"  ⚠️  Parse error: {e}")
             return None
 
+    def _crew_failure_result(
+        self,
+        prospect_input: Dict,
+        execution_time: float
+    ) -> TestResult:
+        """Build failed TestResult for a crew run that produced no output"""
+        return TestResult(
+            prospect_input=prospect_input,
+            passed=False,
+            quality_score=None,
+            output=None,
+            critical_failures=["Crew execution failed"],
+            execution_time=execution_time,
+            error="Crew execution failed or returned no output"
+        )
+
+    def _exception_result(
+        self,
+        prospect_input: Dict,
+        error: Exception,
+        execution_time: float
+    ) -> TestResult:
+        """Build failed TestResult for a test that raised"""
+        return TestResult(
+            prospect_input=prospect_input,
+            passed=False,
+            quality_score=None,
+            output=None,
+            critical_failures=[f"Exception: {str(error)}"],
+            execution_time=execution_time,
+            error=str(error)
+        )
+
+    def _build_result(
+        self,
+        prospect_input: Dict,
+        output: Dict,
+        quality_score: QualityScore,
+        intent_ctx: Dict,
+        execution_time: float
+    ) -> TestResult:
+        """
+        Check critical failures and determine pass/fail for a validated output.
+
+        Args:
+            prospect_input: Original prospect input
+            output: Crew output dictionary
+            quality_score: Quality score from validation
+            intent_ctx: Pre-processed selling intent
+            execution_time: Execution time in seconds
+
+        Returns:
+            TestResult with pass/fail and detailed metrics
+        """
+
+        # Check critical failures
+        critical_failures = self._check_critical_failures(
+            output, prospect_input, quality_score, intent_ctx
+        )
+
+        # Determine pass/fail
+        passed = len(critical_failures) == 0 and quality_score.total_score >= self.quality_threshold
+
+        return TestResult(
+            prospect_input=prospect_input,
+            passed=passed,
+            quality_score=quality_score,
+            output=output,
+            critical_failures=critical_failures,
+            execution_time=execution_time
+        )
+
     def _validate_output(
         self,
         output: Dict,
@@ -355,6 +859,26 @@ class CrewTestRunner:
             QualityScore with detailed metrics
         """
 
+        return self.validator.validate_email(
+            *self._build_validation_input(output, prospect_input)
+        )
+
+    def _build_validation_input(
+        self,
+        output: Dict,
+        prospect_input: Dict
+    ) -> Tuple[str, Dict, Dict]:
+        """
+        Build EmailQualityValidator arguments from crew output.
+
+        Args:
+            output: Crew output dictionary
+            prospect_input: Original prospect input
+
+        Returns:
+            Tuple of (full_email, research_data, prospect_input)
+        """
+
         # Construct full email for validation
         subject_line = output.get('subject_line', '')
         email_body = output.get('email_body', '')
@@ -371,20 +895,36 @@ class CrewTestRunner:
         if output.get('validated_linkedin_profile'):
             research_data['linkedin_confidence'] = 95
 
-        # Run validation
-        quality_score = self.validator.validate_email(
-            full_email,
-            research_data,
-            prospect_input
-        )
+        return full_email, research_data, prospect_input
 
-        return quality_score
+    def _build_intent_context(self, prospect_input: Dict) -> Dict:
+        """
+        Pre-process selling intent once per prospect.
+
+        Args:
+            prospect_input: Prospect data
+
+        Returns:
+            Dictionary with stripped selling_intent, intent_tokens
+            (lowercased words longer than 2 characters) and intent_matcher
+            (single-pass "contains any token" check)
+        """
+
+        selling_intent = (prospect_input.get('selling_intent') or '').strip()
+        intent_tokens = tuple(w for w in selling_intent.lower().split() if len(w) > 2)
+
+        return {
+            'selling_intent': selling_intent,
+            'intent_tokens': intent_tokens,
+            'intent_matcher': _build_keyword_matcher(intent_tokens)
+        }
 
     def _check_critical_failures(
         self,
         output: Dict,
         prospect_input: Dict,
-        quality_score: QualityScore
+        quality_score: QualityScore,
+        intent_ctx: Dict
     ) -> List[str]:
         """
         Check for critical failures that cause automatic test failure.
@@ -394,24 +934,24 @@ class CrewTestRunner:
         - First name not capitalized
         - No CTA (score < 3)
         - Generic messaging when specific intent provided
-        - Missing required output fields
+        - Missing required output fields (reported alone, skips other checks)
 
         Args:
             output: Crew output
             prospect_input: Input data
             quality_score: Quality score from validation
+            intent_ctx: Pre-processed selling intent (see _build_intent_context)
 
         Returns:
             List of critical failure messages
         """
 
-        failures = []
+        # Check required fields - nothing else is meaningful without them
+        missing = [f"Missing {field}" for field in ('subject_line', 'email_body') if not output.get(field)]
+        if missing:
+            return missing
 
-        # Check required fields
-        if not output.get('subject_line'):
-            failures.append("Missing subject_line")
-        if not output.get('email_body'):
-            failures.append("Missing email_body")
+        failures = []
 
         # Check first name capitalization
         first_name = prospect_input.get('first_name', '')
@@ -420,26 +960,24 @@ class CrewTestRunner:
             failures.append("First name not properly capitalized in greeting")
 
         # Check intent compliance (CRITICAL)
-        selling_intent = prospect_input.get('selling_intent', '').strip()
+        selling_intent = intent_ctx['selling_intent']
         if selling_intent and quality_score.intent_score < 12:
             failures.append(f"Intent compliance too low: {quality_score.intent_score}/15 (required: >= 12)")
 
         # Check CTA
-        if quality_score.details['structure']['details'].get('call_to_action', 0) < 3:
+        if quality_score.cta_score < 3:
             failures.append("Missing or weak call-to-action")
 
         # Check generic messaging when intent provided
         if selling_intent:
-            email_lower = email_body.lower()
-            intent_keywords = [w for w in selling_intent.lower().split() if len(w) > 2]
-            has_intent_keyword = any(keyword in email_lower for keyword in intent_keywords)
+            has_intent_keyword = intent_ctx['intent_matcher'](email_body.lower())
 
             if not has_intent_keyword:
                 failures.append("Generic messaging used despite specific selling_intent provided")
 
         return failures
 
-    def _analyze_failure_patterns(self, results: List[TestResult]) -> Dict[str, int]:
+    def _analyze_failure_patterns(self, results: Iterable[TestResult]) -> Dict[str, int]:
         """
         Analyze failure patterns across all results.
 
@@ -447,42 +985,98 @@ class CrewTestRunner:
             Dictionary of failure pattern -> count
         """
 
-        patterns = {}
-
+        patterns = Counter()
         for result in results:
             if not result.passed:
-                # Categorize failures
-                if result.quality_score is None:
-                    patterns['execution_failure'] = patterns.get('execution_failure', 0) + 1
-                else:
-                    # Intent failures
-                    if result.quality_score.intent_score < 12:
-                        patterns['intent_compliance_low'] = patterns.get('intent_compliance_low', 0) + 1
-
-                    # Structure failures
-                    if result.quality_score.structure_score < 28:  # 80% of 35
-                        patterns['structure_issues'] = patterns.get('structure_issues', 0) + 1
-
-                    # Personalization failures
-                    if result.quality_score.personalization_score < 20:  # 80% of 25
-                        patterns['personalization_weak'] = patterns.get('personalization_weak', 0) + 1
-
-                    # Message quality failures
-                    if result.quality_score.message_score < 20:  # 80% of 25
-                        patterns['message_quality_low'] = patterns.get('message_quality_low', 0) + 1
-
-                # Critical failures
-                for failure in result.critical_failures:
-                    if 'Intent compliance' in failure:
-                        patterns['critical_intent_failure'] = patterns.get('critical_intent_failure', 0) + 1
-                    elif 'First name' in failure:
-                        patterns['capitalization_error'] = patterns.get('capitalization_error', 0) + 1
-                    elif 'call-to-action' in failure:
-                        patterns['missing_cta'] = patterns.get('missing_cta', 0) + 1
-                    elif 'Generic messaging' in failure:
-                        patterns['generic_messaging'] = patterns.get('generic_messaging', 0) + 1
-
-        return patterns
+                patterns.update(self._categorize_failure(result))
+
+        return dict(patterns)
+
+    def _categorize_failure(self, result: TestResult) -> Iterator[str]:
+        """
+        Yield failure pattern categories for a single failed result.
+
+        Args:
+            result: Failed test result
+
+        Yields:
+            Failure pattern names
+        """
+
+        score = result.quality_score
+        if score is None:
+            yield 'execution_failure'
+        else:
+            # Intent failures
+            if score.intent_score < 12:
+                yield 'intent_compliance_low'
+
+            # Structure failures
+            if not score.structure_ok:
+                yield 'structure_issues'
+
+            # Personalization failures
+            if not score.personalization_ok:
+                yield 'personalization_weak'
+
+            # Message quality failures
+            if not score.message_ok:
+                yield 'message_quality_low'
+
+        # Critical failures (first matching marker wins)
+        for failure in result.critical_failures:
+            pattern = next(
+                (tag for marker, tag in CRITICAL_FAILURE_PATTERNS if marker in failure),
+                None
+            )
+            if pattern:
+                yield pattern
+
+
+def _build_keyword_matcher(keywords: Tuple[str, ...]) -> Callable[[str], bool]:
+    """
+    Build a check for whether text contains any of the keywords.
+
+    Uses a pyahocorasick automaton when installed, otherwise a regex
+    alternation - both scan the text once regardless of keyword count.
+    """
+
+    if not keywords:
+        return lambda text: False
+
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    pattern = re.compile('|'.join(map(re.escape, keywords)))
+    return lambda text: pattern.search(text) is not None
+
+
+def _read_results(path: str) -> Iterator[TestResult]:
+    """Lazily read TestResults streamed to a JSONL file"""
+    with open(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield TestResult.from_dict(_json_loads(line))
+
+
+# Per-process runner used by run_test_suite(max_workers > 1)
+_worker_runner: Optional[CrewTestRunner] = None
+
+
+def _init_worker(crew_command: str, scratch_dir: Optional[str]):
+    """Create the worker's runner, sharing the suite's scratch directory."""
+    global _worker_runner
+    _worker_runner = CrewTestRunner(crew_command)
+    _worker_runner.scratch_dir = scratch_dir
+
+
+def _run_one(prospect_input: Dict) -> TestResult:
+    """Run a single prospect in a worker process."""
+    return _worker_runner.run_single_test(prospect_input)
 
 
 if __name__ == "__main__":
@@ -1,22 +1,35 @@
 #!/usr/bin/env python3
 """
-Run 10 iterations of the agent and evaluate each against quality criteria
+Run NUM_RUNS (default 10) iterations of the agent and evaluate each against quality criteria
 """
 
-import sys
 import os
-import requests
+import re
+import asyncio
+import aiohttp
 import json
 import time
 from datetime import datetime
 
-sys.path.append('src')
-from sales_personalized_email.email_quality_validator import EmailQualityValidator
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
+try:
+    from uvloop import run as _run_event_loop
+except ImportError:
+    _run_event_loop = asyncio.run
 
 # Test configuration
 AGENT_URL = "https://sales-personalized-email-agent.agentic.canary-orion.keboola.dev"
 API_TOKEN = "8b7c0e2c95b800efea4e75c1da209566e36cf371"
-NUM_RUNS = 10  # Full 10-run consistency test
+NUM_RUNS = int(os.getenv("NUM_RUNS", "10"))  # Full 10-run consistency test by default
 
 # Expected results for validation
 EXPECTED_LINKEDIN = "https://www.linkedin.com/in/milan-kulh%C3%A1nek"
@@ -25,9 +38,157 @@ EXPECTED_COMPANY = "Deloitte"
 EXPECTED_COUNTRY = "Czech Republic" 
 SELLING_INTENT = "coffee machine"
 
-def run_single_test(run_number):
+# Keyword phrases for content analysis
+GENERIC_PHRASES = ("data transformation", "operational efficiency", "analytics platform")
+CTA_PHRASES = ("call", "meeting", "discuss")
+STRONG_CTA_PHRASES = ("when's the best time", "are you free", "when can we")
+WEAK_CTA_PHRASES = ("would you be open", "are you interested")
+
+# Keyword checks only scan the first SCAN_LIMIT chars - intent and CTA belong near
+# the top of an email, and a runaway output must not dominate evaluation time
+SCAN_LIMIT = 8192
+
+def compile_phrases(phrases):
+    """Compile phrases into one alternation so a text is scanned once per category"""
+    return re.compile("|".join(map(re.escape, phrases))) if phrases else None
+
+def contains_any(pattern, text):
+    """Check whether text contains any phrase of a compiled category"""
+    return pattern is not None and pattern.search(text) is not None
+
+INTENT_PATTERN = compile_phrases(SELLING_INTENT.lower().split())
+GENERIC_PATTERN = compile_phrases(GENERIC_PHRASES)
+CTA_PATTERN = compile_phrases(CTA_PHRASES)
+STRONG_CTA_PATTERN = compile_phrases(STRONG_CTA_PHRASES)
+WEAK_CTA_PATTERN = compile_phrases(WEAK_CTA_PHRASES)
+
+def check_intent_compliance(full_lc, subj_lc):
+    """Generic token-based selling intent compliance checks"""
+    return {
+        "intent_keywords_present": contains_any(INTENT_PATTERN, full_lc),
+        "subject_contains_intent": contains_any(INTENT_PATTERN, subj_lc),
+        "generic_forbidden_when_intent_provided": not contains_any(GENERIC_PATTERN, full_lc) if SELLING_INTENT else True,
+        "intent_properly_focused": SELLING_INTENT.lower().replace(" ", "") in full_lc.replace(" ", "") if SELLING_INTENT else True
+    }
+
+# Shared validator - evaluation runs sequentially on the event loop, so no locking needed
+_VALIDATOR = None
+
+def get_validator():
+    """Import and build the shared validator on first use"""
+    global _VALIDATOR
+    if _VALIDATOR is None:
+        from sales_personalized_email.email_quality_validator import EmailQualityValidator
+        _VALIDATOR = EmailQualityValidator()
+    return _VALIDATOR
+
+# Summary table row layout, shared by the header, success and failure rows
+ROW_FMT = "{run:<3} {success:<7} {quality:<7} {linkedin:<8} {title:<6} {country:<7} {intent:<6} {cta:<8} {issues:<20}".format
+
+# Final assessment: the first metric below its minimum decides the verdict
+ASSESSMENTS = (
+    ("success_rate", 80, "❌ SYSTEM RELIABILITY: POOR - Too many failed runs"),
+    ("linkedin_success", 80, "❌ LINKEDIN VALIDATION: FAILING - Not consistently finding correct profile"),
+    ("intent_compliance", 80, "❌ SELLING INTENT: FAILING - Not consistently using provided selling intent keywords"),
+    ("avg_quality", 85, "⚠️  QUALITY: NEEDS IMPROVEMENT - Average quality below acceptable threshold"),
+    ("quality_acceptable", 80, "⚠️  CONSISTENCY: NEEDS IMPROVEMENT - Too many low-quality emails"),
+)
+ASSESSMENT_OK = "✅ SYSTEM: WORKING CORRECTLY - Meeting all quality requirements"
+
+# Transient gateway errors are retried with exponential backoff. Only idempotent
+# requests are retried on gateway errors and dropped connections - a kickoff POST
+# is retried only when the connection was never established, so no run starts twice
+RETRY_STATUSES = (502, 503, 504)
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+MAX_RETRIES = 3
+RETRY_BACKOFF = 0.5  # seconds, doubled per attempt
+
+# Status polling: exponential backoff 1s -> 15s, long-ish read timeout per poll
+POLL_INITIAL_DELAY = 1.0
+POLL_BACKOFF = 1.7
+POLL_MAX_DELAY = 15.0
+STATUS_TIMEOUT = aiohttp.ClientTimeout(sock_connect=5, sock_read=20)
+
+# Completion wait: SSE stream when the agent exposes /runs/{id}/events, else polling
+RUN_TIMEOUT = 300  # 5 minutes
+EVENTS_TIMEOUT = aiohttp.ClientTimeout(total=RUN_TIMEOUT, sock_connect=5)
+TERMINAL_STATUSES = ("completed", "failed")
+
+def create_session():
+    """Create shared keep-alive session with auth headers for all runs"""
+    connector = aiohttp.TCPConnector(limit=NUM_RUNS, keepalive_timeout=60)
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers={
+            "Authorization": f"Bearer {API_TOKEN}",
+            "Content-Type": "application/json"
+        }
+    )
+
+async def request_with_retry(session, method, url, **kwargs):
+    """Send request, retrying gateway errors and dropped connections for idempotent methods"""
+    idempotent = method in IDEMPOTENT_METHODS
+    retry_errors = aiohttp.ClientConnectionError if idempotent else aiohttp.ClientConnectorError
+    for attempt in range(MAX_RETRIES + 1):
+        try:
+            response = await session.request(method, url, **kwargs)
+        except retry_errors:
+            if attempt == MAX_RETRIES:
+                raise
+        else:
+            if not idempotent or response.status not in RETRY_STATUSES or attempt == MAX_RETRIES:
+                return response
+            response.release()
+        await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
+
+async def wait_for_run_events(session, run_id):
+    """Wait on the run's server-sent events stream for a terminal status.
+    
+    Returns the terminal status payload, or None when the agent has no events
+    endpoint (or the stream ends early or sends non-JSON data) so the caller can
+    fall back to polling.
+    """
+    url = f"{AGENT_URL}/runs/{run_id}/events"
+    try:
+        async with session.get(url, headers={"Accept": "text/event-stream"}, timeout=EVENTS_TIMEOUT) as response:
+            if response.status != 200:
+                return None
+            async for line in response.content:
+                if not line.startswith(b"data: "):
+                    continue
+                event = _json_loads(line[6:])
+                if not isinstance(event, dict):
+                    # Keepalives and other non-object payloads carry no status
+                    continue
+                if event.get("status") in TERMINAL_STATUSES:
+                    return event
+    except (aiohttp.ClientError, ValueError):
+        # Malformed event data falls back to polling rather than failing the run
+        return None
+    return None
+
+def run_outcome(run_id, status_data, wait_time):
+    """Build the run result for a terminal status, None while still running"""
+    status = status_data["status"]
+    if status == "completed":
+        return {
+            "run_id": run_id,
+            "status": "completed",
+            "result": status_data.get("result", {}),
+            "wait_time": wait_time
+        }
+    elif status == "failed":
+        return {
+            "run_id": run_id, 
+            "status": "failed",
+            "error": status_data.get("error", "Unknown error"),
+            "wait_time": wait_time
+        }
+    return None
+
+async def run_single_test(session, run_number):
     """Run a single test iteration"""
-    print(f"\n🧪 RUN {run_number}/10 - Starting...")
+    print(f"\n🧪 RUN {run_number}/{NUM_RUNS} - Starting...")
     
     # Trigger agent
     payload = {
@@ -44,59 +205,60 @@ def run_single_test(run_number):
         }
     }
     
-    headers = {
-        "Authorization": f"Bearer {API_TOKEN}",
-        "Content-Type": "application/json"
-    }
-    
     try:
         # Start run
-        response = requests.post(f"{AGENT_URL}/kickoff", headers=headers, json=payload)
-        if response.status_code not in [200, 202]:
-            return {"error": f"Failed to start run: {response.status_code} - {response.text}"}
-        
-        run_data = response.json()
+        async with await request_with_retry(session, "POST", f"{AGENT_URL}/kickoff", data=_json_dumps(payload)) as response:
+            if response.status not in [200, 202]:
+                return {"error": f"Failed to start run: {response.status} - {await response.text()}"}
+            
+            run_data = _json_loads(await response.read())
         run_id = run_data["run_id"]
         print(f"   Run ID: {run_id}")
         
+        start_time = time.monotonic()
+        
+        # Prefer a single completion notification over repeated status polls
+        try:
+            status_data = await wait_for_run_events(session, run_id)
+        except asyncio.TimeoutError:
+            return {"error": f"Timeout after {RUN_TIMEOUT}s"}
+        if status_data is not None:
+            wait_time = round(time.monotonic() - start_time, 1)
+            print(f"   Status: {status_data['status']} via events (waited {wait_time}s)")
+            return run_outcome(run_id, status_data, wait_time)
+        
         # Poll for completion
-        max_wait = 300  # 5 minutes timeout
-        wait_time = 0
+        wait_time = round(time.monotonic() - start_time, 1)
+        delay = POLL_INITIAL_DELAY
         
-        while wait_time < max_wait:
-            time.sleep(10)
-            wait_time += 10
-            
-            status_response = requests.get(f"{AGENT_URL}/runs/{run_id}", headers=headers)
-            if status_response.status_code != 200:
-                return {"error": f"Failed to get status: {status_response.status_code}"}
+        while wait_time < RUN_TIMEOUT:
+            await asyncio.sleep(delay)
+            delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
             
-            status_data = status_response.json()
+            async with await request_with_retry(session, "GET", f"{AGENT_URL}/runs/{run_id}", timeout=STATUS_TIMEOUT) as status_response:
+                if status_response.status != 200:
+                    return {"error": f"Failed to get status: {status_response.status}"}
+                
+                status_data = _json_loads(await status_response.read())
             status = status_data["status"]
+            wait_time = round(time.monotonic() - start_time, 1)
             
             print(f"   Status: {status} (waited {wait_time}s)")
             
-            if status == "completed":
-                result = status_data.get("result", {})
-                return {
-                    "run_id": run_id,
-                    "status": "completed",
-                    "result": result,
-                    "wait_time": wait_time
-                }
-            elif status == "failed":
-                return {
-                    "run_id": run_id, 
-                    "status": "failed",
-                    "error": status_data.get("error", "Unknown error"),
-                    "wait_time": wait_time
-                }
+            outcome = run_outcome(run_id, status_data, wait_time)
+            if outcome is not None:
+                return outcome
         
-        return {"error": f"Timeout after {max_wait}s"}
+        return {"error": f"Timeout after {RUN_TIMEOUT}s"}
         
     except Exception as e:
         return {"error": f"Exception: {str(e)}"}
 
+def read_results(path):
+    """Load evaluations persisted by run_comprehensive_test from an NDJSON file"""
+    with open(path, "rb") as fp:
+        return [_json_loads(line) for line in fp if line.strip()]
+
 def evaluate_run_quality(run_data, run_number):
     """Evaluate a single run against quality criteria"""
     
@@ -116,16 +278,13 @@ def evaluate_run_quality(run_data, run_number):
     follow_up_notes = result.get("follow_up_notes", "")
     
     # Validated information  
-    linkedin_profile = result.get("validated_linkedin_profile", "")
+    linkedin_profile = result.get("validated_linkedin_profile") or result.get("linkedin_profile_validated", "")
     validated_title = result.get("validated_title", "")
     validated_country = result.get("validated_country", "")
     
     # Create full email for quality validation
     full_email = f"Subject: {subject_line}\n\n{email_body}"
     
-    # Quality validation
-    validator = EmailQualityValidator()
-    
     # Simulate research data
     research_data = {
         'linkedin_confidence': 95 if linkedin_profile else 0,
@@ -139,7 +298,13 @@ def evaluate_run_quality(run_data, run_number):
         'selling_intent': 'coffee machine'
     }
     
-    quality_score = validator.validate_email(full_email, research_data, inputs)
+    # Quality validation
+    quality_score = get_validator().validate_email(full_email, research_data, inputs)
+    
+    # Lowercase once for all keyword checks below (heuristic: capped at SCAN_LIMIT chars)
+    full_lc = full_email[:SCAN_LIMIT].lower()
+    body_lc = email_body[:SCAN_LIMIT].lower()
+    subj_lc = subject_line[:SCAN_LIMIT].lower()
     
     # Evaluation criteria
     evaluation = {
@@ -162,18 +327,13 @@ def evaluate_run_quality(run_data, run_number):
         "country_correct": EXPECTED_COUNTRY in validated_country if validated_country else False,
         
         # Content analysis - DYNAMIC SELLING INTENT VALIDATION
-        "selling_intent_compliance": {
-            "intent_keywords_present": any(word in full_email.lower() for word in SELLING_INTENT.lower().split()),
-            "subject_contains_intent": any(word in subject_line.lower() for word in SELLING_INTENT.lower().split()),
-            "generic_forbidden_when_intent_provided": not any(word in full_email.lower() for word in ["data transformation", "operational efficiency", "analytics platform"]) if SELLING_INTENT else True,
-            "intent_properly_focused": SELLING_INTENT.lower().replace(" ", "") in full_email.lower().replace(" ", "") if SELLING_INTENT else True
-        },
+        "selling_intent_compliance": check_intent_compliance(full_lc, subj_lc),
         
         # CTA analysis
         "cta_analysis": {
-            "has_cta": any(phrase in email_body.lower() for phrase in ["call", "meeting", "discuss"]),
-            "strong_cta": any(phrase in email_body.lower() for phrase in ["when's the best time", "are you free", "when can we"]),
-            "weak_cta": any(phrase in email_body.lower() for phrase in ["would you be open", "are you interested"])
+            "has_cta": contains_any(CTA_PATTERN, body_lc),
+            "strong_cta": contains_any(STRONG_CTA_PATTERN, body_lc),
+            "weak_cta": contains_any(WEAK_CTA_PATTERN, body_lc)
         },
         
         # Quality scores
@@ -189,10 +349,10 @@ def evaluate_run_quality(run_data, run_number):
     
     return evaluation
 
-def run_comprehensive_test():
-    """Run all 10 tests and create summary"""
+async def run_comprehensive_test():
+    """Run all NUM_RUNS tests concurrently and create summary"""
     
-    print("🚀 STARTING 10-RUN COMPREHENSIVE AGENT TEST")
+    print(f"🚀 STARTING {NUM_RUNS}-RUN COMPREHENSIVE AGENT TEST")
     print("=" * 70)
     print(f"Target: Milan Kulhanek, Deloitte, coffee machine use case")
     print(f"Expected LinkedIn: {EXPECTED_LINKEDIN}")
@@ -202,20 +362,41 @@ def run_comprehensive_test():
     
     all_results = []
     successful_runs = 0
-    
-    # Run all tests
-    for i in range(1, NUM_RUNS + 1):
-        run_data = run_single_test(i)
-        evaluation = evaluate_run_quality(run_data, i)
-        all_results.append(evaluation)
-        
-        if evaluation["success"]:
-            successful_runs += 1
-            print(f"   ✅ Completed - Quality: {evaluation['quality_score']['total']}/100")
-        else:
-            print(f"   ❌ Failed - {evaluation.get('error', 'Unknown error')}")
+    results_path = f"results_{datetime.now():%Y%m%d_%H%M%S}.ndjson"
+    
+    # Run all tests concurrently - each run is just HTTP waiting on the remote agent.
+    # One wait() over all pending runs wakes for whichever finishes next, so each run
+    # is evaluated and persisted while slower runs are still polling.
+    with open(results_path, "ab") as fp:
+        async with create_session() as session:
+            run_numbers = {
+                asyncio.create_task(run_single_test(session, i)): i
+                for i in range(1, NUM_RUNS + 1)
+            }
+            pending = set(run_numbers)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    run_number = run_numbers[task]
+                    evaluation = evaluate_run_quality(task.result(), run_number)
+                    fp.write(_json_dumps(evaluation) + b"\n")
+                    fp.flush()
+                    
+                    # Keep only a slim copy in memory - the email text lives in the NDJSON file
+                    evaluation.pop("email_body", None)
+                    all_results.append(evaluation)
+                    
+                    if evaluation["success"]:
+                        successful_runs += 1
+                        print(f"   ✅ RUN {run_number} completed - Quality: {evaluation['quality_score']['total']}/100")
+                    else:
+                        print(f"   ❌ RUN {run_number} failed - {evaluation.get('error', 'Unknown error')}")
+    
+    # Runs finish out of order - restore run order for the summary table
+    all_results.sort(key=lambda r: r["run"])
     
     print(f"\n📊 SUMMARY: {successful_runs}/{NUM_RUNS} successful runs")
+    print(f"💾 Full results saved to: {results_path}")
     
     # Generate summary table
     generate_summary_table(all_results)
@@ -223,20 +404,23 @@ def run_comprehensive_test():
     return all_results
 
 def generate_summary_table(results):
-    """Generate comprehensive summary table"""
+    """Generate comprehensive summary table from evaluations or an NDJSON results path"""
+    
+    if isinstance(results, str):
+        results = read_results(results)
     
     print(f"\n{'='*120}")
     print("📊 COMPREHENSIVE TEST RESULTS SUMMARY")
     print(f"{'='*120}")
     
     # Header
-    print(f"{'Run':<3} {'Success':<7} {'Quality':<7} {'LinkedIn':<8} {'Title':<6} {'Country':<7} {'Intent':<6} {'CTA':<8} {'Issues':<20}")
+    print(ROW_FMT(run="Run", success="Success", quality="Quality", linkedin="LinkedIn", title="Title", country="Country", intent="Intent", cta="CTA", issues="Issues"))
     print(f"{'-'*120}")
     
     # Results
     for result in results:
         if not result["success"]:
-            print(f"{result['run']:<3} {'❌':<7} {'N/A':<7} {'❌':<8} {'❌':<6} {'❌':<7} {'❌':<6} {'❌':<8} {result.get('error', 'Failed')[:20]:<20}")
+            print(ROW_FMT(run=result["run"], success="❌", quality="N/A", linkedin="❌", title="❌", country="❌", intent="❌", cta="❌", issues=result.get("error", "Failed")[:20]))
             continue
             
         quality = result["quality_score"]["total"]
@@ -256,7 +440,7 @@ def generate_summary_table(results):
         
         issues_str = ",".join(issues[:2])  # Limit to 2 issues for space
         
-        print(f"{result['run']:<3} {'✅':<7} {quality:<7} {linkedin:<8} {title:<6} {country:<7} {intent:<6} {cta:<8} {issues_str:<20}")
+        print(ROW_FMT(run=result["run"], success="✅", quality=quality, linkedin=linkedin, title=title, country=country, intent=intent, cta=cta, issues=issues_str))
     
     # Statistics
     successful_results = [r for r in results if r["success"]]
@@ -268,16 +452,34 @@ def generate_summary_table(results):
     print("📈 STATISTICS")
     print(f"{'='*120}")
     
+    # Accumulate every counter in a single pass over the successful runs
+    linkedin_count = title_count = country_count = intent_count = strong_cta_count = 0
+    acceptable_count = quality_total = 0
+    generic_when_intent = subject_missing_intent = 0
+    for r in successful_results:
+        compliance = r["selling_intent_compliance"]
+        quality_score = r["quality_score"]
+        linkedin_count += r["linkedin_correct"]
+        title_count += r["title_correct"]
+        country_count += r["country_correct"]
+        intent_count += compliance["intent_keywords_present"]
+        generic_when_intent += not compliance["generic_forbidden_when_intent_provided"]
+        subject_missing_intent += not compliance["subject_contains_intent"]
+        strong_cta_count += r["cta_analysis"]["strong_cta"]
+        quality_total += quality_score["total"]
+        acceptable_count += quality_score["acceptable"]
+    
     # Success rates
-    success_rate = len(successful_results) / len(results) * 100
-    linkedin_success = sum(1 for r in successful_results if r["linkedin_correct"]) / len(successful_results) * 100
-    title_success = sum(1 for r in successful_results if r["title_correct"]) / len(successful_results) * 100
-    country_success = sum(1 for r in successful_results if r["country_correct"]) / len(successful_results) * 100
-    intent_compliance = sum(1 for r in successful_results if r["selling_intent_compliance"]["intent_keywords_present"]) / len(successful_results) * 100
-    strong_cta_rate = sum(1 for r in successful_results if r["cta_analysis"]["strong_cta"]) / len(successful_results) * 100
+    num_successful = len(successful_results)
+    success_rate = num_successful / len(results) * 100
+    linkedin_success = linkedin_count / num_successful * 100
+    title_success = title_count / num_successful * 100
+    country_success = country_count / num_successful * 100
+    intent_compliance = intent_count / num_successful * 100
+    strong_cta_rate = strong_cta_count / num_successful * 100
     
-    avg_quality = sum(r["quality_score"]["total"] for r in successful_results) / len(successful_results)
-    quality_acceptable = sum(1 for r in successful_results if r["quality_score"]["acceptable"]) / len(successful_results) * 100
+    avg_quality = quality_total / num_successful
+    quality_acceptable = acceptable_count / num_successful * 100
     
     print(f"Overall Success Rate:        {success_rate:.1f}%")
     print(f"LinkedIn Validation:         {linkedin_success:.1f}%")
@@ -289,34 +491,28 @@ def generate_summary_table(results):
     print(f"Quality Acceptable (≥85):    {quality_acceptable:.1f}%")
     
     # Issue analysis
-    intent_missing = sum(1 for r in successful_results if not r["selling_intent_compliance"]["intent_keywords_present"])
-    generic_when_intent = sum(1 for r in successful_results if not r["selling_intent_compliance"]["generic_forbidden_when_intent_provided"])
-    subject_missing_intent = sum(1 for r in successful_results if not r["selling_intent_compliance"]["subject_contains_intent"])
+    intent_missing = num_successful - intent_count
     
     print(f"\n🚨 ISSUE FREQUENCY:")
-    print(f"Missing selling intent keywords: {intent_missing}/{len(successful_results)} runs")
-    print(f"Generic messaging when intent provided: {generic_when_intent}/{len(successful_results)} runs")
-    print(f"Subject line missing intent keywords: {subject_missing_intent}/{len(successful_results)} runs")
+    print(f"Missing selling intent keywords: {intent_missing}/{num_successful} runs")
+    print(f"Generic messaging when intent provided: {generic_when_intent}/{num_successful} runs")
+    print(f"Subject line missing intent keywords: {subject_missing_intent}/{num_successful} runs")
     
     # Final assessment
     print(f"\n{'='*120}")
     print("🎯 FINAL ASSESSMENT")
     print(f"{'='*120}")
     
-    if success_rate < 80:
-        print("❌ SYSTEM RELIABILITY: POOR - Too many failed runs")
-    elif linkedin_success < 80:
-        print("❌ LINKEDIN VALIDATION: FAILING - Not consistently finding correct profile")
-    elif intent_compliance < 80:
-        print("❌ SELLING INTENT: FAILING - Not consistently using provided selling intent keywords")
-    elif avg_quality < 85:
-        print("⚠️  QUALITY: NEEDS IMPROVEMENT - Average quality below acceptable threshold")
-    elif quality_acceptable < 80:
-        print("⚠️  CONSISTENCY: NEEDS IMPROVEMENT - Too many low-quality emails")
-    else:
-        print("✅ SYSTEM: WORKING CORRECTLY - Meeting all quality requirements")
+    metrics = {
+        "success_rate": success_rate,
+        "linkedin_success": linkedin_success,
+        "intent_compliance": intent_compliance,
+        "avg_quality": avg_quality,
+        "quality_acceptable": quality_acceptable
+    }
+    print(next((message for metric, minimum, message in ASSESSMENTS if metrics[metric] < minimum), ASSESSMENT_OK))
         
     print(f"{'='*120}")
 
 if __name__ == "__main__":
-    run_comprehensive_test()
\ No newline at end of file
+    _run_event_loop(run_comprehensive_test())
\ No newline at end of file
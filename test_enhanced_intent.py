@@ -3,12 +3,53 @@
 Test the enhanced selling intent enforcement system
 """
 
-import sys
 import os
-sys.path.append('src')
+from types import MappingProxyType
 
 from sales_personalized_email.email_quality_validator import EmailQualityValidator
 
+# Read-only sample data shared by every test run
+_SAMPLE_RESEARCH = MappingProxyType({
+    'linkedin_confidence': 95,
+    'achievements': ('Partner promotion',),
+    'company_achievements': ('Industry leader',)
+})
+
+_SAMPLE_INPUTS_COFFEE = MappingProxyType({
+    'first_name': 'Milan',
+    'company': 'Deloitte', 
+    'title': 'Partner',
+    'selling_intent': 'coffee machine data analytics and reporting'
+})
+
+_SAMPLE_INPUTS_NO_INTENT = MappingProxyType({
+    'first_name': 'Milan',
+    'company': 'Deloitte', 
+    'title': 'Partner',
+    'selling_intent': ''  # No intent
+})
+
+# Per-category breakdown printed for each scored email
+SCORE_TEMPLATE = (
+    "   Total: {total}/100\n"
+    "   Structure: {structure}/35\n"
+    "   Personalization: {personalization}/25\n"
+    "   Message: {message}/25\n"
+    "   🎯 SELLING INTENT: {intent}/15"
+)
+
+
+def _format_score(score):
+    """Render a QualityScore breakdown with SCORE_TEMPLATE"""
+    return SCORE_TEMPLATE.format(
+        total=score.total_score,
+        structure=score.structure_score,
+        personalization=score.personalization_score,
+        message=score.message_score,
+        intent=score.intent_score
+    )
+
+
 def test_enhanced_intent_enforcement():
     """Test enhanced selling intent enforcement"""
     
@@ -17,18 +58,9 @@ def test_enhanced_intent_enforcement():
     print("=" * 60)
     
     # Test inputs
-    sample_research = {
-        'linkedin_confidence': 95,
-        'achievements': ['Partner promotion'],
-        'company_achievements': ['Industry leader']
-    }
+    sample_research = _SAMPLE_RESEARCH
     
-    sample_inputs_coffee = {
-        'first_name': 'Milan',
-        'company': 'Deloitte', 
-        'title': 'Partner',
-        'selling_intent': 'coffee machine data analytics and reporting'
-    }
+    sample_inputs_coffee = _SAMPLE_INPUTS_COFFEE
     
     # Test Case 1: GOOD Coffee Machine Email (should score high)
     print("\n📧 TEST 1: GOOD Coffee Machine Focus")
@@ -48,8 +80,6 @@ Would you be open to a brief 15-minute call to explore coffee machine data optim
 
 Best regards,"""
 
-    score1 = validator.validate_email(good_coffee_email, sample_research, sample_inputs_coffee)
-    
     # Test Case 2: BAD Generic Email (should score much lower now)
     print("\n📧 TEST 2: BAD Generic Data Platform (Should Score MUCH Lower)")
     print("-" * 50)
@@ -68,45 +98,38 @@ Would you be open to a brief 15-minute call to explore our data platform?
 
 Best regards,"""
 
-    score2 = validator.validate_email(bad_generic_email, sample_research, sample_inputs_coffee)
-    
     # Test Case 3: No Intent (should not penalize)
     print("\n📧 TEST 3: No Selling Intent Specified (Should Not Penalize)")
     print("-" * 50)
     
-    sample_inputs_no_intent = {
-        'first_name': 'Milan',
-        'company': 'Deloitte', 
-        'title': 'Partner',
-        'selling_intent': ''  # No intent
-    }
+    sample_inputs_no_intent = _SAMPLE_INPUTS_NO_INTENT
     
-    score3 = validator.validate_email(bad_generic_email, sample_research, sample_inputs_no_intent)
+    # Validate the three independent cases in one batch call
+    batch = [
+        (good_coffee_email, sample_research, sample_inputs_coffee),
+        (bad_generic_email, sample_research, sample_inputs_coffee),
+        (bad_generic_email, sample_research, sample_inputs_no_intent)
+    ]
+    score1, score2, score3 = validator.validate_email_batch(batch)
+    intent_details1 = score1.details['selling_intent']['details']
+    intent_details2 = score2.details['selling_intent']['details']
     
     # Display results
-    print("\n" + "=" * 60)
-    print("📊 ENHANCED SELLING INTENT RESULTS")
-    print("=" * 60)
-    
-    print(f"✅ GOOD Coffee Email:")
-    print(f"   Total: {score1.total_score}/100")
-    print(f"   Structure: {score1.structure_score}/35")
-    print(f"   Personalization: {score1.personalization_score}/25")
-    print(f"   Message: {score1.message_score}/25")
-    print(f"   🎯 SELLING INTENT: {score1.intent_score}/15")
-    print(f"   Intent Details: {score1.details['selling_intent']['details']}")
-    
-    print(f"\n❌ BAD Generic Email (with coffee intent):")
-    print(f"   Total: {score2.total_score}/100")
-    print(f"   Structure: {score2.structure_score}/35")
-    print(f"   Personalization: {score2.personalization_score}/25") 
-    print(f"   Message: {score2.message_score}/25")
-    print(f"   🎯 SELLING INTENT: {score2.intent_score}/15")
-    print(f"   Intent Details: {score2.details['selling_intent']['details']}")
-    
-    print(f"\n✅ Generic Email (NO intent specified):")
-    print(f"   Total: {score3.total_score}/100")
-    print(f"   🎯 SELLING INTENT: {score3.intent_score}/15 (full points - no intent required)")
+    lines = [
+        "\n" + "=" * 60,
+        "📊 ENHANCED SELLING INTENT RESULTS",
+        "=" * 60,
+        f"✅ GOOD Coffee Email:",
+        _format_score(score1),
+        f"   Intent Details: {intent_details1}",
+        f"\n❌ BAD Generic Email (with coffee intent):",
+        _format_score(score2),
+        f"   Intent Details: {intent_details2}",
+        f"\n✅ Generic Email (NO intent specified):",
+        f"   Total: {score3.total_score}/100",
+        f"   🎯 SELLING INTENT: {score3.intent_score}/15 (full points - no intent required)"
+    ]
+    print("\n".join(lines))
     
     # Calculate the difference
     score_difference = score1.total_score - score2.total_score